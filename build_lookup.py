@@ -0,0 +1,43 @@
+"""
+预生成翻译表：
+读取Database下的JSON数据, 建立中->英、中->韩翻译表并写入Database/lookup.pkl,
+程序启动时直接读取该文件, 无需再解析全部JSON。
+修改Database中的数据后需重新运行此脚本。
+"""
+
+
+import sys
+import pickle
+from translator_data import TranslationLoader, NO_COUNTRY_DATA, UNKNOWN_NAME
+
+
+def main():
+    loader = TranslationLoader().build()
+
+    # 存在加载异常时不生成文件, 避免程序读取到不完整的翻译表
+    for error in (loader.en_error, loader.kr_error):
+        if error:
+            print(error)
+            return 1
+
+    # 存在未能解析的名称时同样不生成文件
+    unresolved = [
+        f"{lang} {name}：{result}"
+        for lang, table in (('中->英', loader.en_table), ('中->韩', loader.kr_table))
+        for name, result in table.items()
+        if result in (NO_COUNTRY_DATA, UNKNOWN_NAME)
+    ]
+    if unresolved:
+        print("以下名称未能解析出翻译结果：")
+        print('\n'.join(unresolved))
+        return 1
+
+    with open(TranslationLoader.lookup_path, 'wb') as f:
+        pickle.dump((loader.en_table, loader.kr_table), f, protocol=5)
+
+    print(f"已生成 {TranslationLoader.lookup_path}：中->英{len(loader.en_table)}条, 中->韩{len(loader.kr_table)}条")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
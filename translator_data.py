@@ -0,0 +1,224 @@
+"""
+翻译数据与单实例检查(不依赖Qt, 可供build_lookup.py单独使用)
+"""
+
+
+import sys
+import os
+import re
+import glob
+import pickle
+import socket
+from types import MappingProxyType
+
+# 优先使用orjson解析JSON，未安装时回退至标准库json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# 别名匹配正则(exegesis中以{}包裹的名称)
+_ALIAS_RE = re.compile(r'\{([^}]+)\}')
+
+# 无法解析名称时写入翻译表的占位结果(build_lookup.py据此拒绝生成文件)
+NO_COUNTRY_DATA = '未找到翻译数据信息'  # 缺少对应的国家数据
+UNKNOWN_NAME = 'Unknown'  # 国家数据中缺少该HID的名称
+
+
+class SingleInstanceChecker:
+    """单实例检查器(通过独占本地端口实现, 支持全部平台)"""
+    __slots__ = ('port', 'sock')
+
+    def __init__(self, port):
+        self.port = port
+        self.sock = None
+
+    def is_already_running(self):
+        """检查是否已有实例在运行"""
+        sock = None
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if hasattr(socket, 'SO_EXCLUSIVEADDRUSE'):
+                # Windows下禁止其他进程复用该端口
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        except OSError as e:
+            # 无法创建套接字时不做单实例限制(与原互斥锁异常处理一致)
+            print(f"互斥锁检查异常: {e}")
+            if sock is not None:
+                sock.close()
+            return False
+
+        try:
+            sock.bind(('127.0.0.1', self.port))
+        except OSError:
+            # 端口已被占用，说明有其他实例在运行
+            sock.close()
+            return True
+
+        # 成功占用端口，当前是第一个实例(进程退出时由系统自动释放)
+        self.sock = sock
+        return False
+
+    def release(self):
+        """释放互斥锁"""
+        if self.sock:
+            try:
+                self.sock.close()
+                self.sock = None
+            except Exception as e:
+                print(f"释放互斥锁异常: {e}")
+
+
+class TranslationLoader:
+    """翻译数据加载器(在后台线程中运行, 不访问任何界面控件)"""
+    # 预生成的翻译表(由build_lookup.py生成)
+    lookup_path = 'Database/lookup.pkl'
+
+    def __init__(self):
+        self.country_data_cache = {}  # 国家数据缓存(One/SK共用)
+        self.en_error = None  # One主数据加载异常信息
+        self.kr_error = None  # SK主数据加载异常信息
+
+    def load(self):
+        """加载翻译表(优先读取预生成文件, 不存在时从JSON数据建立)"""
+        if not self._load_prebuilt():
+            self.build()
+        self._freeze_tables()
+        return self
+
+    def _load_prebuilt(self):
+        """读取预生成的翻译表"""
+        try:
+            # JSON数据比预生成文件新时(修改数据后未重新生成)改为从JSON数据建立
+            lookup_mtime = os.path.getmtime(self.lookup_path)
+            if any(os.path.getmtime(p) > lookup_mtime for p in glob.glob('Database/Cs*.json')):
+                print(f"预生成翻译表 {self.lookup_path} 已过期, 将从JSON数据重新建立")
+                return False
+
+            with open(self.lookup_path, 'rb') as f:
+                en_table, kr_table = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"加载预生成翻译表时异常：{str(e)}")
+            return False
+
+        # 格式不符(文件损坏或旧版本生成)时改为从JSON数据建立
+        if not (self._is_valid_table(en_table) and self._is_valid_table(kr_table)):
+            print(f"预生成翻译表 {self.lookup_path} 格式无效, 将从JSON数据重新建立")
+            return False
+
+        self.en_table, self.kr_table = en_table, kr_table
+        return True
+
+    @staticmethod
+    def _is_valid_table(table):
+        """检查翻译表是否为 名称(str) -> 翻译结果(str) 的字典"""
+        return isinstance(table, dict) and all(
+            isinstance(k, str) and isinstance(v, str) for k, v in table.items()
+        )
+
+    def build(self):
+        """加载全部JSON数据并建立翻译表"""
+        self._preload_country_data()  # 预加载全部国家数据
+        self.load_main_data()
+        self.load_sk_main_data()  # 加载SK主数据
+        self._build_lookup()  # 预先解析全部翻译结果
+        return self
+
+    def _preload_country_data(self):
+        """一次性加载Database下全部国家数据(跳过主数据文件)"""
+        for file_path in glob.glob('Database/Cs*.json'):
+            file_name = os.path.basename(file_path)
+            if file_name.endswith('_main.json'):
+                continue
+
+            country = file_name[2:-5]
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+                if not content.strip():
+                    continue  # 尚未填充的数据文件
+                self.country_data_cache[country] = _loads(content)
+            except Exception as e:
+                print(f"加载[{country}]数据时异常：{str(e)}")
+
+    def load_main_data(self):
+        """加载主数据文件并建立名称映射"""
+        # 名称 -> 行号, 以及按行号存储的Country/HID(别名与原名共用同一行)
+        self._idx = {}
+        self._country = []
+        self._hid = []
+        try:
+            with open('Database/CsOne_main.json', 'rb') as f:
+                main_data = _loads(f.read())
+
+            # 建立名称到Country/HID的映射
+            for name, info in main_data.items():
+                idx = len(self._country)
+                self._country.append(info['Country'])
+                self._hid.append(info['HID'])
+                self._idx[name] = idx
+
+                # 处理别名
+                exegesis = info.get('exegesis', '')
+                # 使用正则进行匹配(无{}时跳过)
+                aliases = _ALIAS_RE.findall(exegesis) if '{' in exegesis else ()
+                for alias in aliases:
+                    self._idx[alias] = idx
+        except Exception as e:
+            self.en_error = f'加载One主数据时异常：{str(e)}'
+
+    def load_sk_main_data(self):
+        """加载主数据文件并建立名称映射"""
+        # 名称 -> 行号, 以及按行号存储的Country/HID(别名与原名共用同一行)
+        self._sk_idx = {}
+        self._sk_country = []
+        self._sk_hid = []
+        try:
+            with open('Database/CsSK_main.json', 'rb') as f:
+                sk_main_data = _loads(f.read())
+
+            # 建立名称到Country/HID的映射
+            for name, info in sk_main_data.items():
+                idx = len(self._sk_country)
+                self._sk_country.append(info['Country'])
+                self._sk_hid.append(info['HID'])
+                self._sk_idx[name] = idx
+
+                # 处理别名
+                exegesis = info.get('exegesis', '')
+                # 使用正则进行匹配(无{}时跳过)
+                aliases = _ALIAS_RE.findall(exegesis) if '{' in exegesis else ()
+                for alias in aliases:
+                    self._sk_idx[alias] = idx
+        except Exception as e:
+            self.kr_error = f'加载SK主数据时异常：{str(e)}'
+
+    def _build_lookup(self):
+        """建立名称到中->英、中->韩翻译结果的映射表"""
+        # 每行只解析一次, 别名直接复用所在行的结果
+        en_names = [self._resolve_name(c, h) for c, h in zip(self._country, self._hid)]
+        self.en_table = {name: en_names[i] for name, i in self._idx.items()}
+
+        kr_names = [self._resolve_name(c, h) for c, h in zip(self._sk_country, self._sk_hid)]
+        self.kr_table = {name: kr_names[i] for name, i in self._sk_idx.items()}
+
+    def _freeze_tables(self):
+        """驻留翻译表中的字符串并将其设为只读"""
+        intern = sys.intern
+        self.en_table = MappingProxyType({intern(k): intern(v) for k, v in self.en_table.items()})
+        self.kr_table = MappingProxyType({intern(k): intern(v) for k, v in self.kr_table.items()})
+
+    def _resolve_name(self, country, hid):
+        """根据Country/HID解析出翻译后的名称"""
+        country_data = self.country_data_cache.get(country)
+        if not country_data:
+            return NO_COUNTRY_DATA
+        name = country_data.get(hid, {}).get('name')
+        if not name:
+            print(f"[{country}]数据中缺少HID为{hid}的名称")
+            return UNKNOWN_NAME
+        return name
@@ -0,0 +1,240 @@
+"""
+翻译器窗口(仅在确认没有其他实例运行后由main()导入)
+"""
+
+
+import os
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLineEdit, QPushButton, QHBoxLayout
+from PySide6.QtCore import QTimer, QPropertyAnimation, QObject, QRunnable, QThreadPool, Signal
+from translator_data import TranslationLoader
+
+
+# 窗口淡入淡出动画(默认关闭, 设置环境变量GI_TRANSLATION_ANIM=1开启)
+_ANIMATION_ENABLED = os.environ.get('GI_TRANSLATION_ANIM') == '1'
+
+
+# 窗口图标缓存(首次使用时加载)
+_APP_ICON = None
+
+
+def _app_icon():
+    """获取窗口图标(进行缓存)"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon('Database/hk4e_cn.ico')
+    return _APP_ICON
+
+
+class _LoadSignals(QObject):
+    """后台加载完成信号"""
+    finished = Signal(object)
+
+
+class _LoadWorker(QRunnable):
+    """在线程池中执行TranslationLoader"""
+    def __init__(self):
+        super().__init__()
+        self.signals = _LoadSignals()
+
+    def run(self):
+        loader = TranslationLoader()
+        try:
+            loader.load()
+        except Exception as e:
+            # 加载失败时使用空翻译表, 并在输出框中显示异常信息
+            loader.en_table, loader.kr_table = {}, {}
+            loader.en_error = loader.kr_error = f'加载翻译数据时异常：{str(e)}'
+        # 无论成功与否都通知界面, 避免一直显示"加载中…"
+        self.signals.finished.emit(loader)
+
+
+class TranslatorApp(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        self.en_table = None  # 中->英翻译表(后台加载完成前为None)
+        self.kr_table = None  # 中->韩翻译表(后台加载完成前为None)
+        self._last_en = ''  # 输出框1当前内容
+        self._last_kr = ''  # 输出框2当前内容
+        # 输入变化时触发翻译(40ms防抖, 连续输入时只翻译最后一次)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(40)
+        self._debounce.timeout.connect(lambda: self.translate(self.input_line.text()))
+        self.input_line.textChanged.connect(self._on_text_changed)
+
+        # 复制成功提示的恢复计时器(220ms, 连续点击时重新计时)
+        self._copy_reset_timer_1 = QTimer(self)
+        self._copy_reset_timer_1.setSingleShot(True)
+        self._copy_reset_timer_1.setInterval(220)
+        self._copy_reset_timer_1.timeout.connect(lambda: self.copy_button_1.setText("📋复制📋"))
+        self._copy_reset_timer_2 = QTimer(self)
+        self._copy_reset_timer_2.setSingleShot(True)
+        self._copy_reset_timer_2.setInterval(220)
+        self._copy_reset_timer_2.timeout.connect(lambda: self.copy_button_2.setText("📋复制📋"))
+        self.setFixedSize(self.size())  # 锁定窗口大小
+
+        # 设置窗口图标（文件不存在时为空图标）
+        self.setWindowIcon(_app_icon())
+
+        # 初始化动画效果
+        if _ANIMATION_ENABLED:
+            self._init_animation()
+
+        # 在线程池中加载翻译数据, 窗口无需等待加载完成即可显示
+        worker = _LoadWorker()
+        worker.signals.finished.connect(self._on_data_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _init_animation(self):
+        """初始化动画效果"""
+        # 淡入动画
+        self.fade_in_anim = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_in_anim.setDuration(66)
+        self.fade_in_anim.setStartValue(0)
+        self.fade_in_anim.setEndValue(1)
+
+        # 淡出动画
+        self.fade_out_anim = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_out_anim.setDuration(66)
+        self.fade_out_anim.setStartValue(1)
+        self.fade_out_anim.setEndValue(0)
+        self.fade_out_anim.finished.connect(self._on_fade_out_finished)
+
+        # 关闭标志
+        self.is_closing = False
+
+    def initUI(self):
+        # 创建界面元素
+        layout = QVBoxLayout()
+
+        # 输入框设置
+        self.input_line = QLineEdit(self)
+        self.input_line.setPlaceholderText("输入需翻译的角色中文名称：")
+
+        # 只读输出, 提供可进行复制内容的输入框
+        output_layout_1 = QHBoxLayout()
+        self.output_edit_1 = QLineEdit(self)
+        self.output_edit_1.setReadOnly(True)
+        self.output_edit_1.setPlaceholderText("中->英")
+        # 按钮设置
+        self.copy_button_1 = QPushButton("📋复制📋", self)
+        self.copy_button_1.setFixedWidth(100)
+
+        output_layout_1.addWidget(self.output_edit_1, 1)
+        output_layout_1.addWidget(self.copy_button_1, 0)
+
+        output_layout_2 = QHBoxLayout()
+        # 只读输出, 提供可进行复制内容的输入框
+        self.output_edit_2 = QLineEdit(self)
+        self.output_edit_2.setReadOnly(True)
+        self.output_edit_2.setPlaceholderText("中->韩")
+        # 按钮设置
+        self.copy_button_2 = QPushButton("📋复制📋", self)
+        self.copy_button_2.setFixedWidth(100)
+
+        output_layout_2.addWidget(self.output_edit_2, 1)
+        output_layout_2.addWidget(self.copy_button_2, 0)
+
+        # 布局设置
+        layout.addWidget(self.input_line)
+        layout.addLayout(output_layout_1)
+        layout.addLayout(output_layout_2)
+        self.setLayout(layout)
+
+        # 事件绑定
+        self.copy_button_1.clicked.connect(lambda: self.copy_to_clipboard(1))
+        self.copy_button_2.clicked.connect(lambda: self.copy_to_clipboard(2))
+
+        # 窗口设置
+        self.setWindowTitle('V1.0')
+        self.resize(360, 140)
+
+    def showEvent(self, event):
+        """显示事件处理"""
+        super().showEvent(event)
+        if _ANIMATION_ENABLED:
+            self.fade_in_anim.start()  # 窗口显示时执行淡入动画
+        self.activateWindow()  # 激活窗口
+        self.setFocus()  # 设置焦点
+
+    def closeEvent(self, event):
+        """窗口关闭事件"""
+        if not _ANIMATION_ENABLED:
+            # 未开启动画时直接关闭并释放互斥锁
+            if hasattr(self, 'instance_checker'):
+                self.instance_checker.release()
+            event.accept()
+        elif not self.is_closing:
+            # 首次关闭请求，开始淡出动画
+            self.is_closing = True
+            self.fade_out_anim.start()
+            event.ignore()  # 忽略关闭事件，等待动画完成
+        else:
+            # 动画完成后的真正关闭
+            # 释放互斥锁
+            if hasattr(self, 'instance_checker'):
+                self.instance_checker.release()
+            event.accept()
+
+    def _on_fade_out_finished(self):
+        """淡出动画完成事件"""
+        # 动画完成后真正关闭窗口
+        super().close()
+
+    def copy_to_clipboard(self, button_id):
+        """复制翻译结果到剪贴板"""
+        if button_id == 1:
+            text = self.output_edit_1.text()
+            button = self.copy_button_1
+            reset_timer = self._copy_reset_timer_1
+        else:
+            text = self.output_edit_2.text()
+            button = self.copy_button_2
+            reset_timer = self._copy_reset_timer_2
+
+        if text:
+            QApplication.clipboard().setText(text)
+            # 显示复制成功提示（220ms）
+            button.setText("✅")
+            reset_timer.start()
+
+    def _on_data_loaded(self, loader):
+        """翻译数据加载完成事件"""
+        self.en_table = loader.en_table
+        self.kr_table = loader.kr_table
+        self.translate(self.input_line.text())  # 翻译加载期间已输入的内容
+
+        # 显示加载异常信息
+        self._set_outputs(loader.en_error or self._last_en, loader.kr_error or self._last_kr)
+
+    def _on_text_changed(self):
+        """输入变化事件(重新开始防抖计时)"""
+        self._debounce.start()
+
+    def translate(self, text):
+        """执行翻译逻辑"""
+        if not text:
+            if self._last_en or self._last_kr:  # 输出框已为空时无需处理
+                self._set_outputs('', '')
+            return
+
+        if self.en_table is None:
+            # 翻译数据仍在加载中
+            self._set_outputs("加载中…", "加载中…")
+            return
+
+        self._set_outputs(
+            self.en_table.get(text, "无此翻译结果"),  # (中->英翻译)
+            self.kr_table.get(text, "无此翻译结果"),  # (中->韩翻译)
+        )
+
+    def _set_outputs(self, en, kr):
+        """更新输出框(内容未变化时跳过, 避免重复刷新控件)"""
+        if en != self._last_en:
+            self.output_edit_1.setText(en)
+            self._last_en = en
+        if kr != self._last_kr:
+            self.output_edit_2.setText(kr)
+            self._last_kr = kr